@@ -1,6 +1,7 @@
 """Application configuration using dotenv."""
 
 import os
+import threading
 from dataclasses import dataclass
 
 from dotenv import load_dotenv
@@ -79,20 +80,24 @@ class Settings:
 
 
 _cached_settings: Settings | None = None
+_settings_lock = threading.Lock()
 
 
 def get_settings() -> Settings:
-    """Get cached settings instance."""
+    """Get cached settings instance (thread-safe)."""
     global _cached_settings
     if _cached_settings is None:
-        _cached_settings = Settings()
+        with _settings_lock:
+            if _cached_settings is None:
+                _cached_settings = Settings()
     return _cached_settings
 
 
 def reset_settings() -> None:
     """Clear cached settings. Useful for testing or CLI overrides."""
     global _cached_settings
-    _cached_settings = None
+    with _settings_lock:
+        _cached_settings = None
 
 
 if __name__ == "__main__":
@@ -82,7 +82,7 @@ def test_queries():
             print(f"  {c['composite_method']} = {' + '.join(c['components'])}")
 
         # Test 9: Search methods
-        print("\n[Test 9] Search Methods Containing 'RAG'")
+        print("\n[Test 9] Search Methods Matching 'RAG'")
         results = client.search_methods("RAG", limit=5)
         for r in results:
             print(f"  {r['name']} ({r['family']})")
@@ -1,5 +1,7 @@
 """LangGraph pipeline for knowledge graph exploration."""
 
+import threading
+
 from langgraph.graph import StateGraph, END
 
 from .state import AgentState
@@ -40,6 +42,23 @@ def create_agent_graph() -> StateGraph:
     return workflow.compile()
 
 
+_compiled_graph = None
+_compiled_graph_lock = threading.Lock()
+
+
+def _get_agent_graph():
+    """Get the compiled pipeline, building it on first use.
+
+    The graph topology is static, so it is compiled once per process.
+    """
+    global _compiled_graph
+    if _compiled_graph is None:
+        with _compiled_graph_lock:
+            if _compiled_graph is None:
+                _compiled_graph = create_agent_graph()
+    return _compiled_graph
+
+
 def run_agent(query: str) -> AgentState:
     """Run the agent pipeline on a user query.
 
@@ -49,8 +68,8 @@ def run_agent(query: str) -> AgentState:
     Returns:
         Final state with answer and sources
     """
-    # Create graph
-    graph = create_agent_graph()
+    # Get compiled graph
+    graph = _get_agent_graph()
 
     # Initialize state
     initial_state: AgentState = {
@@ -1,10 +1,53 @@
 """Graph retrieval node for executing Cypher queries against Neo4j."""
 
+import atexit
+import threading
+from typing import Optional
+
 from config.settings import get_settings
 from src.graph.client import Neo4jClient
 
 from ..state import AgentState
 
+_client: Optional[Neo4jClient] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> Neo4jClient:
+    """Get the shared Neo4j client, connecting on first use.
+
+    The client (and its driver connection pool) lives for the whole process,
+    so each query reuses pooled Bolt connections instead of a new handshake.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                settings = get_settings()
+                client = Neo4jClient(
+                    uri=settings.neo4j_uri,
+                    username=settings.neo4j_username,
+                    password=settings.neo4j_password,
+                    database=settings.neo4j_database,
+                )
+                client.connect()
+                _client = client
+    return _client
+
+
+@atexit.register
+def close_client() -> None:
+    """Close the shared Neo4j client, if one was opened.
+
+    Registered with atexit so the driver's pooled connections are released on
+    interpreter shutdown; safe to call again (the next query reconnects).
+    """
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
 
 def retrieve_from_graph(state: AgentState) -> AgentState:
     """Execute Cypher query and retrieve results from Neo4j.
@@ -42,18 +85,9 @@ def retrieve_from_graph(state: AgentState) -> AgentState:
     print(f"[Graph Retriever] Executing query with params: {parameters}")
 
     try:
-        # Connect to Neo4j
-        settings = get_settings()
-        client = Neo4jClient(
-            uri=settings.neo4j_uri,
-            username=settings.neo4j_username,
-            password=settings.neo4j_password,
-            database=settings.neo4j_database,
-        )
-        client.connect()
-
         # Execute query
-        results = client.run_cypher(cypher_template, parameters)
+        # Planner templates only read, so they can be served by any cluster member
+        results = _get_client().run_cypher(cypher_template, parameters, read_only=True)
 
         # Convert results to serializable format
         kg_results = _serialize_results(results)
@@ -63,9 +97,6 @@ def retrieve_from_graph(state: AgentState) -> AgentState:
 
         print(f"[Graph Retriever] Retrieved {len(kg_results)} results")
 
-        # Close connection
-        client.close()
-
     except Exception as e:
         print(f"[Graph Retriever] Error: {e}")
         state["error"] = f"Graph retrieval failed: {str(e)}"
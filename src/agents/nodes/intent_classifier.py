@@ -8,6 +8,37 @@ from ..providers.router import get_provider
 from ..state import AgentState
 
 
+_INTENT_RE = re.compile(r"INTENT:\s*(lookup|path|comparison|expansion)", re.IGNORECASE)
+_ENTITIES_RE = re.compile(r"ENTITIES:\s*(.+)", re.IGNORECASE)
+
+# Keyword table for fallback intent classification, checked in priority order
+_INTENT_KEYWORDS = (
+    # Comparison keywords
+    ("comparison", ("vs", "versus", "compare", "difference between")),
+    # Path/relationship keywords
+    ("path", ("implement", "support", "address", "method for", "framework for")),
+    # Expansion keywords
+    ("expansion", ("latest", "new", "recent", "2025", "2026", "future")),
+)
+
+# Known entities for fallback extraction (this could be expanded or replaced with NER),
+# paired with their lowercase form so matching never re-lowercases per call
+_KNOWN_ENTITIES = tuple(
+    (entity, entity.lower())
+    for entity in [
+        # Principles
+        "Perception", "Memory", "Planning", "Reasoning", "Tool Use",
+        "Reflection", "Grounding", "Learning", "Multi-Agent", "Guardrails", "Tracing",
+        # Methods
+        "ReAct", "Chain-of-Thought", "CoT", "RAG", "Self-Consistency",
+        "Tree of Thoughts", "Plan-and-Execute", "LATS",
+        # Implementations
+        "LangChain", "CrewAI", "AutoGen", "LangGraph", "Semantic Kernel",
+        # Standards
+        "MCP", "Agent-to-Agent", "A2A", "OpenTelemetry", "OTel",
+    ]
+)
+
 INTENT_CLASSIFICATION_PROMPT = """You are an intent classifier for a knowledge graph about Agentic AI.
 
 The knowledge graph contains:
@@ -89,7 +120,7 @@ def classify_intent(state: AgentState) -> AgentState:
 
 def _extract_intent(content: str) -> Literal["lookup", "path", "comparison", "expansion"]:
     """Extract intent from LLM response."""
-    match = re.search(r"INTENT:\s*(lookup|path|comparison|expansion)", content, re.IGNORECASE)
+    match = _INTENT_RE.search(content)
     if match:
         return match.group(1).lower()
     return "lookup"  # default fallback
@@ -97,7 +128,7 @@ def _extract_intent(content: str) -> Literal["lookup", "path", "comparison", "ex
 
 def _extract_entities(content: str) -> list[str]:
     """Extract entities from LLM response."""
-    match = re.search(r"ENTITIES:\s*(.+)", content, re.IGNORECASE)
+    match = _ENTITIES_RE.search(content)
     if match:
         entities_str = match.group(1).strip()
         # Split by comma and clean up
@@ -110,17 +141,9 @@ def _fallback_intent_classification(query: str) -> Literal["lookup", "path", "co
     """Simple heuristic-based intent classification as fallback."""
     query_lower = query.lower()
 
-    # Comparison keywords
-    if any(kw in query_lower for kw in ["vs", "versus", "compare", "difference between"]):
-        return "comparison"
-
-    # Path/relationship keywords
-    if any(kw in query_lower for kw in ["implement", "support", "address", "method for", "framework for"]):
-        return "path"
-
-    # Expansion keywords
-    if any(kw in query_lower for kw in ["latest", "new", "recent", "2025", "2026", "future"]):
-        return "expansion"
+    for intent, keywords in _INTENT_KEYWORDS:
+        if any(kw in query_lower for kw in keywords):
+            return intent
 
     # Default to lookup
     return "lookup"
@@ -128,23 +151,5 @@ def _fallback_intent_classification(query: str) -> Literal["lookup", "path", "co
 
 def _fallback_entity_extraction(query: str) -> list[str]:
     """Simple entity extraction as fallback."""
-    # Known entities (this could be expanded or replaced with NER)
-    known_entities = [
-        # Principles
-        "Perception", "Memory", "Planning", "Reasoning", "Tool Use",
-        "Reflection", "Grounding", "Learning", "Multi-Agent", "Guardrails", "Tracing",
-        # Methods
-        "ReAct", "Chain-of-Thought", "CoT", "RAG", "Self-Consistency",
-        "Tree of Thoughts", "Plan-and-Execute", "LATS",
-        # Implementations
-        "LangChain", "CrewAI", "AutoGen", "LangGraph", "Semantic Kernel",
-        # Standards
-        "MCP", "Agent-to-Agent", "A2A", "OpenTelemetry", "OTel",
-    ]
-
-    entities = []
-    for entity in known_entities:
-        if entity.lower() in query.lower():
-            entities.append(entity)
-
-    return entities
+    query_lower = query.lower()
+    return [entity for entity, entity_lower in _KNOWN_ENTITIES if entity_lower in query_lower]
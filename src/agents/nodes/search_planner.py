@@ -13,8 +13,8 @@ CYPHER_TEMPLATES = {
         OPTIONAL MATCH (m)-[addr:ADDRESSES]->(p:Principle)
         OPTIONAL MATCH (i:Implementation)-[impl:IMPLEMENTS]->(m)
         RETURN m,
-               collect(DISTINCT {principle: p, role: addr.role, weight: addr.weight}) as principles,
-               collect(DISTINCT {implementation: i, support_level: impl.support_level}) as implementations
+               [x IN collect(DISTINCT {principle: p, role: addr.role, weight: addr.weight}) WHERE x.principle IS NOT NULL] as principles,
+               [x IN collect(DISTINCT {implementation: i, support_level: impl.support_level}) WHERE x.implementation IS NOT NULL] as implementations
         LIMIT 10
     """,
     "lookup_implementation": """
@@ -25,7 +25,7 @@ CYPHER_TEMPLATES = {
         OPTIONAL MATCH (i)-[impl:IMPLEMENTS]->(m:Method)
         OPTIONAL MATCH (m)-[addr:ADDRESSES]->(p:Principle)
         RETURN i,
-               collect(DISTINCT {method: m, support_level: impl.support_level}) as methods,
+               [x IN collect(DISTINCT {method: m, support_level: impl.support_level}) WHERE x.method IS NOT NULL] as methods,
                collect(DISTINCT p) as principles
         LIMIT 10
     """,
@@ -37,7 +37,7 @@ CYPHER_TEMPLATES = {
         OPTIONAL MATCH (m:Method)-[addr:ADDRESSES]->(p)
         OPTIONAL MATCH (i:Implementation)-[:IMPLEMENTS]->(m)
         RETURN p,
-               collect(DISTINCT {method: m, role: addr.role, weight: addr.weight}) as methods,
+               [x IN collect(DISTINCT {method: m, role: addr.role, weight: addr.weight}) WHERE x.method IS NOT NULL] as methods,
                count(DISTINCT i) as implementation_count
         LIMIT 10
     """,
@@ -49,7 +49,7 @@ CYPHER_TEMPLATES = {
         MATCH (m:Method)-[addr:ADDRESSES]->(p)
         OPTIONAL MATCH (i:Implementation)-[impl:IMPLEMENTS]->(m)
         RETURN p, m, addr,
-               collect(DISTINCT {implementation: i, support_level: impl.support_level}) as implementations
+               [x IN collect(DISTINCT {implementation: i, support_level: impl.support_level}) WHERE x.implementation IS NOT NULL] as implementations
         ORDER BY addr.weight DESC
         LIMIT 20
     """,
@@ -61,7 +61,7 @@ CYPHER_TEMPLATES = {
         MATCH (i:Implementation)-[impl:IMPLEMENTS]->(m)
         OPTIONAL MATCH (m)-[addr:ADDRESSES]->(p:Principle)
         RETURN m, i, impl,
-               collect(DISTINCT {principle: p, role: addr.role}) as principles
+               [x IN collect(DISTINCT {principle: p, role: addr.role}) WHERE x.principle IS NOT NULL] as principles
         ORDER BY impl.support_level
         LIMIT 20
     """,
@@ -90,6 +90,13 @@ CYPHER_TEMPLATES = {
     """,
 }
 
+# Lowercase keywords used to guess an entity's node type
+_PRINCIPLE_KEYWORDS = (
+    "perception", "memory", "planning", "reasoning", "tool use",
+    "reflection", "grounding", "learning", "multi-agent", "guardrails", "tracing",
+)
+_IMPLEMENTATION_KEYWORDS = ("langchain", "crewai", "autogen", "langgraph", "semantic kernel")
+
 
 def plan_search(state: AgentState) -> AgentState:
     """Plan search strategy based on intent and entities.
@@ -149,12 +156,10 @@ def _plan_lookup(entities: list[str]) -> dict:
     entity_lower = entity.lower()
 
     # Check if it's a known principle
-    principles = ["perception", "memory", "planning", "reasoning", "tool use",
-                  "reflection", "grounding", "learning", "multi-agent", "guardrails", "tracing"]
-    if any(p in entity_lower for p in principles):
+    if any(p in entity_lower for p in _PRINCIPLE_KEYWORDS):
         template_key = "lookup_principle"
     # Check if it's likely an implementation
-    elif any(impl in entity_lower for impl in ["langchain", "crewai", "autogen", "langgraph", "semantic kernel"]):
+    elif any(impl in entity_lower for impl in _IMPLEMENTATION_KEYWORDS):
         template_key = "lookup_implementation"
     # Default to method lookup
     else:
@@ -182,14 +187,10 @@ def _plan_path(entities: list[str]) -> dict:
     entity_lower = entity.lower()
 
     # Determine path direction based on entity type
-    principles = ["perception", "memory", "planning", "reasoning", "tool use",
-                  "reflection", "grounding", "learning", "multi-agent", "guardrails", "tracing"]
-    implementations = ["langchain", "crewai", "autogen", "langgraph", "semantic kernel"]
-
-    if any(p in entity_lower for p in principles):
+    if any(p in entity_lower for p in _PRINCIPLE_KEYWORDS):
         # Principle → Methods → Implementations
         template_key = "path_principle_to_methods"
-    elif any(impl in entity_lower for impl in implementations):
+    elif any(impl in entity_lower for impl in _IMPLEMENTATION_KEYWORDS):
         # Implementation → Methods → Principles
         template_key = "path_implementation_to_principles"
     else:
@@ -148,7 +148,7 @@ def _simple_format_results(results: list[dict], intent: str) -> str:
     if not results:
         return "No results found in the knowledge graph."
 
-    # Extract key information
+    # Extract key information (stop once the 10-item limit is reached)
     answer_parts = []
 
     for record in results:
@@ -161,9 +161,13 @@ def _simple_format_results(results: list[dict], intent: str) -> str:
                     answer_parts.append(f"- **{name}**: {desc}")
                 else:
                     answer_parts.append(f"- **{name}**")
+                if len(answer_parts) >= 10:
+                    break
+        if len(answer_parts) >= 10:
+            break
 
     if answer_parts:
-        return "Here's what I found:\n\n" + "\n".join(answer_parts[:10])  # Limit to 10 items
+        return "Here's what I found:\n\n" + "\n".join(answer_parts)
     else:
         return f"Found {len(results)} results, but couldn't format them properly."
 
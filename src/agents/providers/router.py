@@ -1,14 +1,12 @@
 """Provider router for user-optional LLM usage."""
 
+import functools
 import os
+import threading
 from typing import Optional
-from openai import DefaultHttpxClient
 
 from config.settings import get_settings
 
-from .anthropic import AnthropicProvider
-from .openai import OpenAIProvider
-from .gemini import GeminiProvider
 from .base import LLMProvider
 
 
@@ -18,6 +16,11 @@ _PROVIDER_DEFAULTS = {
     "gemini": "gemini-2.5-flash",
 }
 
+# Built providers keyed by (provider, model, api_key, token limits), so the SDK
+# client and its HTTP connection pool are reused across get_provider() calls
+_provider_cache: dict[tuple[str, str, str, int, int], LLMProvider] = {}
+_provider_cache_lock = threading.Lock()
+
 
 def get_provider() -> Optional[LLMProvider]:
     """Return a provider instance based on settings, or None if disabled."""
@@ -25,31 +28,63 @@ def get_provider() -> Optional[LLMProvider]:
     if not settings.llm_enabled:
         return None
 
-    provider = _build_provider(settings.llm_provider, settings)
+    provider = _build_provider(
+        settings.llm_provider,
+        settings,
+        settings.llm_max_classify_tokens,
+        settings.llm_max_synthesize_tokens,
+    )
     if provider is not None:
-        provider.max_classify_tokens = settings.llm_max_classify_tokens
-        provider.max_synthesize_tokens = settings.llm_max_synthesize_tokens
         return provider
 
     if settings.llm_fallback_provider:
-        provider = _build_provider(settings.llm_fallback_provider, settings)
+        provider = _build_provider(
+            settings.llm_fallback_provider,
+            settings,
+            settings.llm_fallback_max_classify_tokens,
+            settings.llm_fallback_max_synthesize_tokens,
+        )
         if provider is not None:
-            provider.max_classify_tokens = settings.llm_fallback_max_classify_tokens
-            provider.max_synthesize_tokens = settings.llm_fallback_max_synthesize_tokens
             return provider
 
     return None
 
 
-def _build_provider(provider_name: str, settings) -> Optional[LLMProvider]:
+def _build_provider(
+    provider_name: str,
+    settings,
+    max_classify_tokens: int,
+    max_synthesize_tokens: int,
+) -> Optional[LLMProvider]:
     if not provider_name:
         return None
 
     provider = provider_name.lower()
     model = settings.llm_model or _PROVIDER_DEFAULTS.get(provider)
+    api_key = getattr(settings, f"{provider}_api_key", None)
+    key = (provider, model, api_key, max_classify_tokens, max_synthesize_tokens)
+    instance = _provider_cache.get(key)
+    if instance is None:
+        with _provider_cache_lock:
+            instance = _provider_cache.get(key)
+            if instance is None:
+                instance = _create_provider(provider, model, settings)
+                if instance is None:
+                    return None
+                # Token limits are fixed per cached instance, never mutated per call
+                instance.max_classify_tokens = max_classify_tokens
+                instance.max_synthesize_tokens = max_synthesize_tokens
+                _provider_cache[key] = instance
+    return instance
+
+
+def _create_provider(provider: str, model: str, settings) -> Optional[LLMProvider]:
+    # Vendor SDKs are imported only for the provider actually selected
     if provider == "anthropic":
         if not settings.anthropic_api_key:
             return None
+        from .anthropic import AnthropicProvider
+
         return AnthropicProvider(
             api_key=settings.anthropic_api_key,
             model=model,
@@ -59,6 +94,8 @@ def _build_provider(provider_name: str, settings) -> Optional[LLMProvider]:
     if provider == "openai":
         if not settings.openai_api_key:
             return None
+        from .openai import OpenAIProvider
+
         return OpenAIProvider(
             api_key=settings.openai_api_key,
             model=model,
@@ -68,6 +105,8 @@ def _build_provider(provider_name: str, settings) -> Optional[LLMProvider]:
     if provider == "gemini":
         if not settings.gemini_api_key:
             return None
+        from .gemini import GeminiProvider
+
         return GeminiProvider(
             api_key=settings.gemini_api_key,
             model=model,
@@ -78,15 +117,28 @@ def _build_provider(provider_name: str, settings) -> Optional[LLMProvider]:
 
 
 def _build_http_client() -> Optional[object]:
-    ssl_cert_file = os.getenv("SSL_CERT_FILE")
+    return _httpx_client(os.getenv("SSL_CERT_FILE"))
+
+
+def _build_http_client_openai() -> Optional[object]:
+    return _openai_http_client(os.getenv("SSL_CERT_FILE"))
+
+
+# SSL clients are memoized per CA bundle so the bundle is parsed once and the
+# connection pool is shared by every provider built with it
+@functools.lru_cache(maxsize=8)
+def _httpx_client(ssl_cert_file: Optional[str]) -> Optional[object]:
     if ssl_cert_file and os.path.exists(ssl_cert_file):
         import httpx
 
         return httpx.Client(verify=ssl_cert_file)
     return None
 
-def _build_http_client_openai() -> Optional[object]:
-    cafile = os.getenv("SSL_CERT_FILE")
+
+@functools.lru_cache(maxsize=8)
+def _openai_http_client(cafile: Optional[str]) -> Optional[object]:
+    from openai import DefaultHttpxClient
+
     if cafile and os.path.isfile(cafile):
         return DefaultHttpxClient(verify=cafile)
     return DefaultHttpxClient()
@@ -6,18 +6,28 @@ Supports cypher file execution, CRUD operations, and domain-specific queries.
 """
 
 import logging
+import threading
+import time
+from collections import OrderedDict
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Generator, Optional
+from typing import Generator, Iterator, Optional
 
-from neo4j import GraphDatabase, Driver, Session, TrustAll
-from neo4j.exceptions import ServiceUnavailable, AuthError
+from neo4j import GraphDatabase, Driver, RoutingControl, Session, Transaction, TrustAll
+from neo4j.exceptions import ServiceUnavailable, AuthError, DriverError, Neo4jError
 
 from config import get_settings
 from .schema import StatsResult
 
 logger = logging.getLogger(__name__)
 
+_LUCENE_SPECIAL_CHARS = set('+-&|!(){}[]^"~*?:\\/')
+
+
+def _escape_lucene(text: str) -> str:
+    """Escape Lucene query syntax so user input is matched literally."""
+    return "".join(f"\\{ch}" if ch in _LUCENE_SPECIAL_CHARS else ch for ch in text)
+
 
 class Neo4jClient:
     """Neo4j database client with KG operations."""
@@ -28,13 +38,43 @@ class Neo4jClient:
         username: Optional[str] = None,
         password: Optional[str] = None,
         database: Optional[str] = None,
+        max_connection_pool_size: int = 50,
+        connection_acquisition_timeout: float = 30.0,
+        max_connection_lifetime: float = 3600.0,
+        cache_ttl: float = 60.0,
+        cache_maxsize: int = 1024,
     ):
-        settings = get_settings()
+        # Only resolve settings when explicit credentials are incomplete
+        settings = None
+        if not (uri and username and password and database):
+            settings = get_settings()
         self._uri = uri or settings.neo4j_uri
         self._username = username or settings.neo4j_username
         self._password = password or settings.neo4j_password
         self._database = database or getattr(settings, "neo4j_database", "neo4j")
         self._driver: Optional[Driver] = None
+        self._has_apoc: Optional[bool] = None
+        self._pool_config = {
+            "max_connection_pool_size": max_connection_pool_size,
+            "connection_acquisition_timeout": connection_acquisition_timeout,
+            "max_connection_lifetime": max_connection_lifetime,
+        }
+
+        # Read-query result cache: (query, params) -> (expires_at, rows).
+        # Disabled with cache_ttl=0; every write path calls invalidate_cache().
+        self._cache_ttl = cache_ttl
+        self._cache_maxsize = cache_maxsize
+        self._read_cache: OrderedDict[tuple[str, str], tuple[float, list[dict]]] = OrderedDict()
+        self._cache_generation = 0
+        self._cache_lock = threading.RLock()
+
+        # Label-specialized query strings, built on first use per label
+        self._q_get_node: dict[str, str] = {}
+        self._q_all_nodes: dict[str, str] = {}
+        self._q_create_node: dict[tuple[str, frozenset], str] = {}
+        self._q_create_rel: dict[tuple[str, str, str], str] = {}
+        self._q_create_nodes: dict[str, str] = {}
+        self._q_create_rels: dict[tuple[str, str, str], str] = {}
 
     # ========================================================================
     # Connection Management
@@ -47,7 +87,8 @@ class Neo4jClient:
                 self._uri,
                 auth=(self._username, self._password),
                 encrypted=True,
-                trusted_certificates=TrustAll()  # SSL 검증 비활성화
+                trusted_certificates=TrustAll(),  # SSL 검증 비활성화
+                **self._pool_config,
             )
             self._driver.verify_connectivity()
             logger.info(f"Connected to Neo4j at {self._uri}")
@@ -80,14 +121,32 @@ class Neo4jClient:
         return self._driver
 
     @contextmanager
-    def session(self) -> Generator[Session, None, None]:
-        """Get a database session."""
-        session = self.driver.session(database=self._database)
+    def session(self, fetch_size: Optional[int] = None) -> Generator[Session, None, None]:
+        """Get a database session (fetch_size=-1 pulls all records at once)."""
+        config = {"fetch_size": fetch_size} if fetch_size is not None else {}
+        session = self.driver.session(database=self._database, **config)
         try:
             yield session
         finally:
             session.close()
 
+    @contextmanager
+    def transaction(self) -> Generator[Transaction, None, None]:
+        """
+        Run several queries in one explicit transaction.
+
+        Commits when the block exits normally, rolls back on error. The read
+        cache is invalidated afterwards either way.
+        """
+        # The driver's transaction context commits on success and rolls back on
+        # error, and never rolls back a transaction whose commit already failed
+        try:
+            with self.session() as session:
+                with session.begin_transaction() as tx:
+                    yield tx
+        finally:
+            self.invalidate_cache()
+
     # ========================================================================
     # Cypher File Execution
     # ========================================================================
@@ -103,7 +162,25 @@ class Neo4jClient:
             Number of statements executed
         """
         logger.info(f"Running Cypher file: {filepath}")
+        statements = self._read_cypher_statements(filepath)
+
+        # Execute statements
+        with self.session() as session:
+            for i, stmt in enumerate(statements, 1):
+                try:
+                    session.run(stmt)
+                    logger.debug(f"Executed statement {i}/{len(statements)}")
+                except Exception as e:
+                    logger.warning(f"Statement {i} failed: {e}")
+                    logger.debug(f"Statement: {stmt[:100]}...")
+
+        self.invalidate_cache()
+        logger.info(f"Completed {len(statements)} statements from {filepath.name}")
+        return len(statements)
 
+    @staticmethod
+    def _read_cypher_statements(filepath: Path) -> list[str]:
+        """Read a Cypher file and split it into statements (comments skipped)."""
         with open(filepath, "r", encoding="utf-8") as f:
             content = f.read()
 
@@ -128,18 +205,7 @@ class Neo4jClient:
             if stmt:
                 statements.append(stmt)
 
-        # Execute statements
-        with self.session() as session:
-            for i, stmt in enumerate(statements, 1):
-                try:
-                    session.run(stmt)
-                    logger.debug(f"Executed statement {i}/{len(statements)}")
-                except Exception as e:
-                    logger.warning(f"Statement {i} failed: {e}")
-                    logger.debug(f"Statement: {stmt[:100]}...")
-
-        logger.info(f"Completed {len(statements)} statements from {filepath.name}")
-        return len(statements)
+        return statements
 
     # ========================================================================
     # Schema & Seed Data
@@ -162,7 +228,18 @@ class Neo4jClient:
             raise FileNotFoundError(f"Schema file not found: {schema_file}")
 
         logger.info("Setting up database schema...")
-        count = self.run_cypher_file(schema_file)
+
+        # Every statement is `IF NOT EXISTS`, so run them all in one transaction
+        statements = self._read_cypher_statements(schema_file)
+        try:
+            with self.transaction() as tx:
+                for stmt in statements:
+                    tx.run(stmt)
+            count = len(statements)
+        except (Neo4jError, DriverError) as e:
+            logger.warning(f"Batched schema setup failed, retrying per statement: {e}")
+            count = self.run_cypher_file(schema_file)
+
         logger.info("Schema setup complete")
         return count
 
@@ -187,12 +264,48 @@ class Neo4jClient:
         logger.info("Seed data loaded")
         return count
 
-    def clear_database(self) -> None:
-        """Clear all nodes and relationships. USE WITH CAUTION."""
+    def has_apoc(self) -> bool:
+        """Check (once per client) whether APOC periodic procedures are installed."""
+        if self._has_apoc is None:
+            try:
+                with self.session() as session:
+                    session.run("CALL apoc.help('periodic') YIELD name RETURN name LIMIT 1").consume()
+                self._has_apoc = True
+            except Neo4jError:
+                self._has_apoc = False
+            logger.debug(f"APOC available: {self._has_apoc}")
+        return self._has_apoc
+
+    def clear_database(self, batch_size: int = 10000) -> None:
+        """
+        Clear all nodes and relationships. USE WITH CAUTION.
+
+        Uses apoc.periodic.iterate when available so deletes are committed in
+        batches of `batch_size` nodes instead of one heap-bound transaction.
+        """
         logger.warning("Clearing all data from database!")
         with self.session() as session:
-            session.run("MATCH ()-[r]->() DELETE r")
-            session.run("MATCH (n) DELETE n")
+            if self.has_apoc():
+                # periodic.iterate reports batch failures in its result row, not as errors
+                summary = session.run(
+                    "CALL apoc.periodic.iterate("
+                    "'MATCH (n) RETURN n', 'DETACH DELETE n', "
+                    "{batchSize: $batch_size, parallel: false}) "
+                    "YIELD failedOperations, failedBatches, errorMessages "
+                    "RETURN failedOperations, failedBatches, errorMessages",
+                    batch_size=batch_size,
+                ).single()
+                if summary["failedOperations"] or summary["errorMessages"]:
+                    self.invalidate_cache()
+                    logger.error(
+                        f"Clearing database failed: {summary['failedOperations']} operations "
+                        f"in {summary['failedBatches']} batches: {summary['errorMessages']}"
+                    )
+                    raise RuntimeError(f"Clearing database failed: {summary['errorMessages']}")
+            else:
+                session.run("MATCH ()-[r]->() DELETE r")
+                session.run("MATCH (n) DELETE n")
+        self.invalidate_cache()
         logger.info("Database cleared")
 
     def initialize(self, clear_first: bool = False) -> StatsResult:
@@ -221,11 +334,69 @@ class Neo4jClient:
     # Raw Cypher Execution
     # ========================================================================
 
-    def run_cypher(self, query: str, params: Optional[dict] = None) -> list[dict]:
-        """Execute arbitrary Cypher query."""
-        with self.session() as session:
-            result = session.run(query, **(params or {}))
-            return [dict(record) for record in result]
+    def run_cypher(
+        self, query: str, params: Optional[dict] = None, read_only: bool = False
+    ) -> list[dict]:
+        """
+        Execute arbitrary Cypher query.
+
+        Args:
+            query: Cypher query
+            params: Query parameters
+            read_only: Route to a reader (follower) instead of the leader;
+                the query must not write. Other queries invalidate the read cache.
+
+        Returns:
+            Result records as dicts
+        """
+        try:
+            records, _, _ = self.driver.execute_query(
+                query,
+                params or {},
+                database_=self._database,
+                routing_=RoutingControl.READ if read_only else RoutingControl.WRITE,
+            )
+        finally:
+            if not read_only:
+                self.invalidate_cache()
+        return [dict(record) for record in records]
+
+    def run_cypher_cached(self, query: str, params: Optional[dict] = None) -> list[dict]:
+        """
+        Execute a read-only Cypher query, serving repeats from an LRU+TTL cache.
+
+        Entries expire after cache_ttl seconds (0 disables the cache) and are
+        dropped by invalidate_cache(), which run_cypher (unless read_only),
+        transaction() and every write helper call. Writes issued directly on a
+        session() must invalidate explicitly.
+        """
+        if self._cache_ttl <= 0 or self._cache_maxsize <= 0:
+            return self.run_cypher(query, params, read_only=True)
+
+        key = (query, repr(sorted((params or {}).items())))
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._read_cache.get(key)
+            if entry is not None and entry[0] > now:
+                self._read_cache.move_to_end(key)
+                return [dict(row) for row in entry[1]]
+            generation = self._cache_generation
+
+        rows = self.run_cypher(query, params, read_only=True)
+        with self._cache_lock:
+            # Skip the store if a write invalidated the cache while the query ran
+            if generation == self._cache_generation:
+                self._read_cache[key] = (now + self._cache_ttl, rows)
+                self._read_cache.move_to_end(key)
+                while len(self._read_cache) > self._cache_maxsize:
+                    self._read_cache.popitem(last=False)
+        return [dict(row) for row in rows]
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached read results."""
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._read_cache.clear()
 
     # ========================================================================
     # Statistics
@@ -233,18 +404,23 @@ class Neo4jClient:
 
     def get_stats(self) -> StatsResult:
         """Get database statistics."""
-        with self.session() as session:
-            # Node counts by label
-            result = session.run(
-                "MATCH (n) RETURN labels(n)[0] AS label, count(*) AS count"
-            )
-            nodes_by_label = {r["label"]: r["count"] for r in result}
-
-            # Relationship counts by type
-            result = session.run(
-                "MATCH ()-[r]->() RETURN type(r) AS type, count(*) AS count"
-            )
-            rels_by_type = {r["type"]: r["count"] for r in result}
+        # Both aggregations run as subqueries of one statement: a single round-trip
+        query = """
+        CALL {
+            MATCH (n)
+            WITH labels(n)[0] AS label, count(*) AS count
+            RETURN collect({label: label, count: count}) AS nodes
+        }
+        CALL {
+            MATCH ()-[r]->()
+            WITH type(r) AS type, count(*) AS count
+            RETURN collect({type: type, count: count}) AS rels
+        }
+        RETURN nodes, rels
+        """
+        record = self.run_cypher(query, read_only=True)[0]
+        nodes_by_label = {r["label"]: r["count"] for r in record["nodes"]}
+        rels_by_type = {r["type"]: r["count"] for r in record["rels"]}
 
         return StatsResult(
             total_nodes=sum(nodes_by_label.values()),
@@ -271,7 +447,7 @@ class Neo4jClient:
                collect(DISTINCT i.name) AS implementations
         ORDER BY p.name, m.name
         """
-        return self.run_cypher(query)
+        return self.run_cypher_cached(query)
 
     def get_methods_by_principle(self, principle_id: str) -> list[dict]:
         """
@@ -289,7 +465,7 @@ class Neo4jClient:
                a.role AS role, a.weight AS weight
         ORDER BY a.weight DESC, m.name
         """
-        return self.run_cypher(query, {"principle_id": principle_id})
+        return self.run_cypher_cached(query, {"principle_id": principle_id})
 
     def get_implementations_by_method(self, method_id: str) -> list[dict]:
         """
@@ -307,7 +483,7 @@ class Neo4jClient:
                r.support_level AS support_level, r.evidence AS evidence
         ORDER BY r.support_level, i.name
         """
-        return self.run_cypher(query, {"method_id": method_id})
+        return self.run_cypher_cached(query, {"method_id": method_id})
 
     def get_principles_coverage(self) -> list[dict]:
         """
@@ -325,7 +501,7 @@ class Neo4jClient:
                count(DISTINCT i) AS impl_count
         ORDER BY method_count DESC
         """
-        return self.run_cypher(query)
+        return self.run_cypher_cached(query)
 
     # ========================================================================
     # Domain Queries - Standards
@@ -348,7 +524,7 @@ class Neo4jClient:
                r.level AS level
         ORDER BY s.name, i.name
         """
-        return self.run_cypher(query)
+        return self.run_cypher_cached(query)
 
     # ========================================================================
     # Domain Queries - Methods
@@ -361,7 +537,7 @@ class Neo4jClient:
         RETURN m.method_family AS family, count(*) AS count
         ORDER BY count DESC
         """
-        return self.run_cypher(query)
+        return self.run_cypher_cached(query)
 
     def get_composite_methods(self) -> list[dict]:
         """Get composite methods and their components."""
@@ -371,12 +547,16 @@ class Neo4jClient:
                collect(component.name) AS components
         ORDER BY composite.name
         """
-        return self.run_cypher(query)
+        return self.run_cypher_cached(query)
 
     def search_methods(self, keyword: str, limit: int = 10) -> list[dict]:
         """
         Search methods by keyword in name or description.
 
+        Uses the `method_fulltext` index (see neo4j/schema.cypher), so matching
+        is token-based and results are ordered by relevance. The keyword is
+        matched as a phrase; a blank keyword returns no results.
+
         Args:
             keyword: Search term
             limit: Maximum results
@@ -384,14 +564,19 @@ class Neo4jClient:
         Returns:
             List of matching methods
         """
+        if not keyword.strip():
+            return []
+
         query = """
-        MATCH (m:Method)
-        WHERE m.name CONTAINS $keyword OR m.description CONTAINS $keyword
+        CALL db.index.fulltext.queryNodes('method_fulltext', $keyword) YIELD node AS m, score
         RETURN m.id AS id, m.name AS name, m.method_family AS family,
-               m.description AS description
+               m.description AS description, score
+        ORDER BY score DESC
         LIMIT $limit
         """
-        return self.run_cypher(query, {"keyword": keyword, "limit": limit})
+        return self.run_cypher_cached(
+            query, {"keyword": f'"{_escape_lucene(keyword)}"', "limit": limit}
+        )
 
     # ========================================================================
     # Validation Queries
@@ -405,7 +590,7 @@ class Neo4jClient:
         RETURN m.id AS id, m.name AS name
         ORDER BY m.name
         """
-        return self.run_cypher(query)
+        return self.run_cypher_cached(query)
 
     def get_orphan_implementations(self) -> list[dict]:
         """Find implementations not linked to any Method."""
@@ -415,7 +600,7 @@ class Neo4jClient:
         RETURN i.id AS id, i.name AS name
         ORDER BY i.name
         """
-        return self.run_cypher(query)
+        return self.run_cypher_cached(query)
 
     def get_methods_without_paper(self) -> list[dict]:
         """Find methods without a proposing paper or seminal_source."""
@@ -426,7 +611,7 @@ class Neo4jClient:
         RETURN m.id AS id, m.name AS name, m.year_introduced AS year
         ORDER BY m.name
         """
-        return self.run_cypher(query)
+        return self.run_cypher_cached(query)
 
     def get_uncovered_principles(self) -> list[dict]:
         """Find principles with no methods addressing them."""
@@ -435,7 +620,7 @@ class Neo4jClient:
         WHERE NOT (p)<-[:ADDRESSES]-(:Method)
         RETURN p.id AS id, p.name AS name
         """
-        return self.run_cypher(query)
+        return self.run_cypher_cached(query)
 
     # ========================================================================
     # Node Operations
@@ -452,12 +637,40 @@ class Neo4jClient:
         Returns:
             Node properties as dict, or None if not found
         """
-        query = f"MATCH (n:{label} {{id: $id}}) RETURN n"
-        results = self.run_cypher(query, {"id": node_id})
+        query = self._q_get_node.get(label)
+        if query is None:
+            query = self._q_get_node.setdefault(label, f"MATCH (n:{label} {{id: $id}}) RETURN n")
+        results = self.run_cypher_cached(query, {"id": node_id})
         if results:
             return dict(results[0]["n"])
         return None
 
+    def iter_all_nodes(self, label: str, fetch_size: Optional[int] = None) -> Iterator[dict]:
+        """
+        Stream all nodes of a given label, one record at a time.
+
+        Useful for callers that only count or filter, since no intermediate
+        list of records is materialized. The generator holds a pooled session
+        until it is exhausted or closed, so callers that may stop early should
+        wrap it in contextlib.closing():
+
+            with closing(client.iter_all_nodes("Method")) as nodes:
+                first = next(nodes, None)
+
+        Args:
+            label: Node label (e.g., 'Principle', 'Method')
+            fetch_size: Records pulled per round-trip (driver default if None)
+
+        Yields:
+            Node properties
+        """
+        query = self._q_all_nodes.get(label)
+        if query is None:
+            query = self._q_all_nodes.setdefault(label, f"MATCH (n:{label}) RETURN n ORDER BY n.name")
+        with self.session(fetch_size=fetch_size) as session:
+            for record in session.run(query):
+                yield dict(record["n"])
+
     def get_all_nodes(self, label: str) -> list[dict]:
         """
         Get all nodes of a given label.
@@ -468,9 +681,8 @@ class Neo4jClient:
         Returns:
             List of node properties
         """
-        query = f"MATCH (n:{label}) RETURN n ORDER BY n.name"
-        results = self.run_cypher(query)
-        return [dict(r["n"]) for r in results]
+        # The whole result is materialized anyway, so pull it in one batch
+        return list(self.iter_all_nodes(label, fetch_size=-1))
 
     def create_node(self, label: str, properties: dict) -> dict:
         """
@@ -483,11 +695,34 @@ class Neo4jClient:
         Returns:
             Created node properties
         """
-        props_str = ", ".join(f"{k}: ${k}" for k in properties.keys())
-        query = f"CREATE (n:{label} {{{props_str}}}) RETURN n"
+        key = (label, frozenset(properties))
+        query = self._q_create_node.get(key)
+        if query is None:
+            props_str = ", ".join(f"{k}: ${k}" for k in properties.keys())
+            query = self._q_create_node.setdefault(key, f"CREATE (n:{label} {{{props_str}}}) RETURN n")
         results = self.run_cypher(query, properties)
         return dict(results[0]["n"])
 
+    def create_nodes(self, label: str, rows: list[dict], batch_size: int = 1000) -> int:
+        """
+        Create many nodes of one label with a single UNWIND query per batch.
+
+        Args:
+            label: Node label
+            rows: Node properties, one dict per node (each must include 'id')
+            batch_size: Maximum rows sent per transaction
+
+        Returns:
+            Number of nodes created
+        """
+        query = self._q_create_nodes.get(label)
+        if query is None:
+            query = self._q_create_nodes.setdefault(
+                label, f"UNWIND $rows AS row CREATE (n:{label}) SET n = row"
+            )
+        self._write_batches(query, rows, batch_size)
+        return len(rows)
+
     def create_relationship(
         self,
         source_label: str,
@@ -500,6 +735,10 @@ class Neo4jClient:
         """
         Create a relationship between two nodes.
 
+        The relationship is merged on (source, type, target); properties are
+        passed as a single map parameter and applied with `SET r += $props`, so
+        each label/type combination maps to exactly one query string.
+
         Args:
             source_label: Source node label
             source_id: Source node ID
@@ -508,14 +747,72 @@ class Neo4jClient:
             target_id: Target node ID
             properties: Optional relationship properties
         """
-        props = properties or {}
-        props_str = ", ".join(f"{k}: ${k}" for k in props.keys())
-        props_clause = f" {{{props_str}}}" if props_str else ""
-
-        query = f"""
+        key = (source_label, rel_type, target_label)
+        query = self._q_create_rel.get(key)
+        if query is None:
+            query = self._q_create_rel.setdefault(key, f"""
         MATCH (a:{source_label} {{id: $source_id}})
         MATCH (b:{target_label} {{id: $target_id}})
-        MERGE (a)-[r:{rel_type}{props_clause}]->(b)
+        MERGE (a)-[r:{rel_type}]->(b)
+        SET r += $props
         RETURN r
+        """)
+        self.run_cypher(
+            query,
+            {"source_id": source_id, "target_id": target_id, "props": properties or {}},
+        )
+
+    def create_relationships(
+        self,
+        source_label: str,
+        rel_type: str,
+        target_label: str,
+        rows: list[dict],
+        batch_size: int = 1000,
+    ) -> int:
         """
-        self.run_cypher(query, {"source_id": source_id, "target_id": target_id, **props})
+        Create many relationships of one type with a single UNWIND query per batch.
+
+        Args:
+            source_label: Source node label
+            rel_type: Relationship type
+            target_label: Target node label
+            rows: Dicts with 'source_id', 'target_id' and optional 'properties'
+            batch_size: Maximum rows sent per transaction
+
+        Returns:
+            Number of relationship rows submitted
+        """
+        key = (source_label, rel_type, target_label)
+        query = self._q_create_rels.get(key)
+        if query is None:
+            query = self._q_create_rels.setdefault(key, f"""
+            UNWIND $rows AS row
+            MATCH (a:{source_label} {{id: row.source_id}})
+            MATCH (b:{target_label} {{id: row.target_id}})
+            MERGE (a)-[r:{rel_type}]->(b)
+            SET r += row.properties
+            """)
+        params = [
+            {
+                "source_id": row["source_id"],
+                "target_id": row["target_id"],
+                "properties": row.get("properties") or {},
+            }
+            for row in rows
+        ]
+        self._write_batches(query, params, batch_size)
+        return len(params)
+
+    def _write_batches(self, query: str, rows: list[dict], batch_size: int) -> None:
+        """Run an UNWIND $rows query once per batch, each in its own managed transaction."""
+        for start in range(0, len(rows), batch_size):
+            try:
+                # execute_query retries transient errors, so a batch either lands whole or fails
+                self.run_cypher(query, {"rows": rows[start:start + batch_size]})
+            except (Neo4jError, DriverError):
+                logger.error(
+                    f"Batch write failed at row {start} of {len(rows)}: "
+                    f"the first {start} rows were committed, the rest were not"
+                )
+                raise